@@ -3,15 +3,44 @@ Wrapper for the Dominos Pizza UK API
 
 This module provides
 '''
-from dominos.api import Client, VARIANT, PAYMENT_METHOD, FULFILMENT_METHOD
-from dominos.exception import ApiError
+from importlib import import_module
 
+from dominos.exception import ApiError, RateLimitError
+
+# The clients are resolved lazily by __getattr__ below.
+# pylint: disable=undefined-all-variable
 __all__ = [
+    'AsyncClient',
     'Client',
     'ApiError',
+    'RateLimitError',
     'VARIANT',
     'PAYMENT_METHOD',
     'FULFILMENT_METHOD'
 ]
+# pylint: enable=undefined-all-variable
 
 __version__ = '0.0.4'
+
+_LAZY = {
+    'AsyncClient': 'dominos.aio',
+    'Client': 'dominos.api',
+    'VARIANT': 'dominos.api',
+    'PAYMENT_METHOD': 'dominos.api',
+    'FULFILMENT_METHOD': 'dominos.api'
+}
+
+def __getattr__(name):
+    '''
+    Import the clients and their constants on first use, so the models may be
+    used without loading the HTTP stack.
+    '''
+    if name in _LAZY:
+        return getattr(import_module(_LAZY[name]), name)
+    raise AttributeError('module {!r} has no attribute {!r}'.format(__name__, name))
+
+def __dir__():
+    '''
+    List the lazily imported names alongside those already loaded.
+    '''
+    return sorted(set(globals()) | set(_LAZY))
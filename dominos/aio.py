@@ -0,0 +1,121 @@
+'''
+Dominos Pizza API asyncio interface.
+
+This module includes an asynchronous counterpart to the client object. Each API
+method is run on a worker thread so that independent requests, such as
+fetching the menu and the basket or adding several items, may be awaited
+concurrently rather than one after another.
+'''
+import asyncio
+
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial, wraps
+
+import requests
+
+from dominos.api import Client
+from dominos.utils import merge_basket_items
+
+def _delegate(name):
+    '''
+    Create a coroutine function that runs the named client method on the
+    executor of an AsyncClient.
+
+    :param string name: The name of the Client method.
+    :return: A coroutine function wrapping the Client method.
+    :rtype: function
+    '''
+    method = getattr(Client, name)
+
+    @wraps(method)
+    async def wrapper(self, *args, **kargs):
+        if self.client is None:
+            raise RuntimeError('AsyncClient must be entered with "async with" before use')
+        return await self.run(getattr(self.client, name), *args, **kargs)
+
+    return wrapper
+
+class AsyncClient(object):
+    '''
+    Asynchronous API class for the UK version of Dominos pizza website. It must
+    be entered as an asynchronous context manager before use, which creates the
+    underlying Client without blocking the event loop. A session is closed on
+    exit only if the AsyncClient created it.
+    '''
+    def __init__(self, session=None, max_workers=5):
+        self.client = None
+        self._session = session
+        self._own_session = None
+        self._max_workers = max_workers
+        self._executor = None
+
+    async def __aenter__(self):
+        self._executor = ThreadPoolExecutor(max_workers=self._max_workers)
+        if self._session is None:
+            self._own_session = requests.Session()
+
+        try:
+            self.client = await self.run(Client, self._session or self._own_session)
+        except BaseException:
+            await self.__aexit__()
+            raise
+
+        return self
+
+    async def __aexit__(self, *exc_info):
+        try:
+            if self._own_session is not None:
+                self._own_session.close()
+        finally:
+            self.client = None
+            self._own_session = None
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
+    new_session = _delegate('new_session')
+    reset_store = _delegate('reset_store')
+    get_stores = _delegate('get_stores')
+    get_nearest_store = _delegate('get_nearest_store')
+    set_delivery_system = _delegate('set_delivery_system')
+    get_menu = _delegate('get_menu')
+    get_basket = _delegate('get_basket')
+    get_menu_and_basket = _delegate('get_menu_and_basket')
+    add_item_to_basket = _delegate('add_item_to_basket')
+    add_pizza_to_basket = _delegate('add_pizza_to_basket')
+    add_side_to_basket = _delegate('add_side_to_basket')
+    remove_item_from_basket = _delegate('remove_item_from_basket')
+    set_payment_method = _delegate('set_payment_method')
+    set_delivery_address = _delegate('set_delivery_address')
+    process_payment = _delegate('process_payment')
+
+    async def add_items(self, items, concurrency=5):
+        '''
+        Add several items to the current basket concurrently. Identical items
+        of the same variant are added in one request with their quantities
+        combined.
+
+        :param list items: A list of (item, variant, quantity) tuples.
+        :param int concurrency: The maximum number of requests in flight.
+        :return: A list of responses having added the items to the basket.
+        :rtype: list
+        '''
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def add(item):
+            async with semaphore:
+                return await self.add_item_to_basket(*item)
+
+        return await asyncio.gather(*[add(item) for item in merge_basket_items(items)])
+
+    async def run(self, func, *args, **kargs):
+        '''
+        Run a blocking callable on the executor and await its result. The
+        AsyncClient must have been entered.
+
+        :param func func: The blocking callable.
+        :params list args: A list of positional arguments.
+        :params list kargs: A list of keyword arguments.
+        :return: The value returned by the callable.
+        '''
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, partial(func, *args, **kargs))
@@ -5,68 +5,121 @@ This module includes the client object used to make requests to the Dominos
 Pizza UK API. Additionally it provides some global constants that may be used
 as configuration optons to some API methods.
 '''
-from ratelimit import limits, RateLimitException
-from backoff import on_exception, expo
+from concurrent.futures import ThreadPoolExecutor
+from enum import IntEnum
+from operator import attrgetter
 
-from dominos.exception import ApiError
+from backoff import on_exception, runtime
+
+from dominos.exception import ApiError, RateLimitError
 from dominos.models import Stores, Menu, Basket
-from dominos.utils import enum, update_session_headers
+from dominos.throttle import AdaptiveBackoff, TokenBucket, parse_retry_after
+from dominos.utils import TTLCache, configure_session, decode_json, encode_json, merge_basket_items
 
 import requests
 
-VARIANT = enum(PERSONAL=0, SMALL=1, MEDIUM=2, LARGE=3)
-PAYMENT_METHOD = enum(CASH_ON_DELIVERY=0, CARD=1, PAYPAL=2, VISA_CHECKOUT=4)
-FULFILMENT_METHOD = enum(COLLECTION=0, DELIVERY=1)
+class VARIANT(IntEnum):
+    '''
+    Pizza sizes, used as an index into the SKUs of a menu item.
+    '''
+    PERSONAL = 0
+    SMALL = 1
+    MEDIUM = 2
+    LARGE = 3
+
+class PAYMENT_METHOD(IntEnum):
+    '''
+    Payment methods accepted by the remote.
+    '''
+    CASH_ON_DELIVERY = 0
+    CARD = 1
+    PAYPAL = 2
+    VISA_CHECKOUT = 4
+
+class FULFILMENT_METHOD(IntEnum):
+    '''
+    Whether an order is collected from the store or delivered.
+    '''
+    COLLECTION = 0
+    DELIVERY = 1
 
 class Client(object):
     '''
     API class for the UK version of Dominos pizza website.
     '''
-    BASE_URL = 'https://www.dominos.co.uk'
+    __slots__ = ('session', 'limiter', 'backoff', 'cache', '_menu_cache', '_pool')
 
-    def __init__(self, session=requests.session()):
-        self.session = update_session_headers(session)
+    BASE_URL = 'https://www.dominos.co.uk'
+    MENU_TTL = 3600
+    STORES_TTL = 86400
+
+    def __init__(self, session=None):
+        self.session = configure_session(session or requests.Session())
+        self.limiter = TokenBucket(rate=5, capacity=5)
+        self.backoff = AdaptiveBackoff()
+        self.cache = TTLCache()
+        self._menu_cache = {}
+        self._pool = ThreadPoolExecutor(max_workers=2)
         self.reset_store()
 
-    def new_session(self, session):
+    def new_session(self, session=None):
         '''
-        Clear out the current session on the remote and setup a new one.
+        Clear out the current session on the remote and setup a new one. If no
+        session is given the current one is reused with its cookies cleared,
+        keeping its pooled connections alive.
 
+        :param requests.Session session: An optional replacement session.
         :return: A response from having expired the current session.
         :rtype: requests.Response
         '''
-        response = self.__get('/Home/SessionExpire')
-        self.session = update_session_headers(session)
+        response = self.__call_api('GET', '/Home/SessionExpire')
+
+        if session is None:
+            self.session.cookies.clear()
+            self.session.headers.pop('X-XSRF-TOKEN', None)
+        else:
+            self.session = configure_session(session)
 
         return response
 
     def reset_store(self):
         '''
-        Clears out the current store and gets a cookie. Set the cross site
-        request forgery token for each subsequent request.
+        Clears out the current store and gets a cookie. The session picks up
+        the cross site request forgery token from it for each subsequent
+        request.
 
         :return: A response having cleared the current store.
         :rtype: requests.Response
         '''
-        response = self.__get('/Store/Reset')
-
-        token = self.session.cookies['XSRF-TOKEN']
-        self.session.headers.update({'X-XSRF-TOKEN': token})
+        return self.__call_api('GET', '/Store/Reset')
 
-        return response
+    def invalidate(self):
+        '''
+        Forget every cached store search and menu, so that the next call to
+        get_stores, get_nearest_store or get_menu goes to the remote.
+        '''
+        self.cache.clear()
+        self._menu_cache.clear()
 
     def get_stores(self, search_term):
         '''
-        Search for dominos pizza stores using a search term.
+        Search for dominos pizza stores using a search term. Results are cached
+        for STORES_TTL seconds per search term.
 
         :param string search: Search term.
         :return: A list of nearby stores matching the search term.
         :rtype: list
         '''
-        params = {'SearchText': search_term}
-        response = self.__get('/storefindermap/storesearch', params=params)
+        key = ('stores', search_term.lower().strip())
+        data = self.cache.get(key)
+        if data is None:
+            params = {'SearchText': search_term}
+            response = self.__call_api('GET', '/storefindermap/storesearch', params=params)
+            data = decode_json(response)
+            self.cache.set(key, data, self.STORES_TTL)
 
-        return Stores(response.json())
+        # The decoded response is cached so each caller gets its own list.
+        return Stores(data)
 
     def get_nearest_store(self, postcode):
         '''
@@ -97,11 +150,15 @@ class Client(object):
             'storeid': store.store_id
         }
 
-        return self.__post('/Journey/Initialize', json=params)
+        return self.__call_api('POST', '/Journey/Initialize', data=encode_json(params))
 
     def get_menu(self, store):
         '''
-        Retrieve the menu from the selected store.
+        Retrieve the menu from the selected store. Menus are cached for
+        MENU_TTL seconds per store and menu version, so a new menu version is
+        always fetched. Once expired the menu is revalidated against the
+        remote and reused if it has not changed. Only the latest version of
+        each store menu is kept for revalidation.
 
         :param Store store: A store.
         :return: The store menu.
@@ -113,8 +170,31 @@ class Client(object):
             'storeId': store.store_id,
         }
 
-        response = self.__get('/ProductCatalog/GetStoreCatalog', params=params)
-        return Menu(response.json())
+        key = ('menu', store.store_id, store.menu_version, params['collectionOnly'])
+        menu = self.cache.get(key)
+        if menu is not None:
+            return menu
+
+        # Only the latest menu version of each store is kept for revalidation.
+        latest = (store.store_id, params['collectionOnly'])
+        version, validators, menu = self._menu_cache.get(latest, (None, {}, None))
+        if version != store.menu_version:
+            validators, menu = {}, None
+
+        path = '/ProductCatalog/GetStoreCatalog'
+        response = self.__call_api('GET', path, params=params, headers=validators)
+
+        if response.status_code != 304:
+            menu = Menu(decode_json(response))
+            validators = {
+                'If-None-Match': response.headers.get('ETag'),
+                'If-Modified-Since': response.headers.get('Last-Modified')
+            }
+            validators = {k: v for k, v in validators.items() if v}
+            self._menu_cache[latest] = (store.menu_version, validators, menu)
+
+        self.cache.set(key, menu, self.MENU_TTL)
+        return menu
 
     def get_basket(self):
         '''
@@ -123,8 +203,23 @@ class Client(object):
         :return: A response containing the basket for the current session.
         :rtype: requests.Response
         '''
-        response = self.__get('/CheckoutBasket/GetBasket')
-        return Basket(response.json())
+        response = self.__call_api('GET', '/CheckoutBasket/GetBasket')
+        return Basket(decode_json(response))
+
+    def get_menu_and_basket(self, store):
+        '''
+        Retrieve the menu from the selected store and the basket for the
+        current session at the same time. The two requests are independent so
+        they are sent concurrently over the pooled session, from worker
+        threads shared by every call.
+
+        :param Store store: A store.
+        :return: The store menu and the basket.
+        :rtype: tuple
+        '''
+        menu = self._pool.submit(self.get_menu, store)
+        basket = self._pool.submit(self.get_basket)
+        return menu.result(), basket.result()
 
     def add_item_to_basket(self, item, variant=VARIANT.MEDIUM, quantity=1):
         '''
@@ -144,6 +239,17 @@ class Client(object):
             return self.add_side_to_basket(item, quantity)
         return None
 
+    def add_items_to_basket(self, items):
+        '''
+        Add several items to the current basket. Identical items of the same
+        variant are added in one request with their quantities combined.
+
+        :param list items: A list of (item, variant, quantity) tuples.
+        :return: A list of responses having added the items to the basket.
+        :rtype: list
+        '''
+        return [self.add_item_to_basket(*item) for item in merge_basket_items(items)]
+
     def add_pizza_to_basket(self, item, variant=VARIANT.MEDIUM, quantity=1):
         '''
         Add a pizza to the current basket.
@@ -155,7 +261,7 @@ class Client(object):
         :rtype: requests.Response
         '''
         item_variant = item[variant]
-        ingredients = item_variant['ingredients'].update([36, 42])
+        ingredients = [42, 36, *item_variant['ingredients']]
 
         params = {
             'stepId': 0,
@@ -168,7 +274,7 @@ class Client(object):
             'recipeReferrer': 0
         }
 
-        return self.__post('/Basket/AddPizza', json=params)
+        return self.__call_api('POST', '/Basket/AddPizza', data=encode_json(params))
 
     def add_side_to_basket(self, item, quantity=1):
         '''
@@ -187,7 +293,7 @@ class Client(object):
             'ComplimentaryItems': []
         }
 
-        return self.__post('/Basket/AddProduct', json=params)
+        return self.__call_api('POST', '/Basket/AddProduct', data=encode_json(params))
 
     def remove_item_from_basket(self, idx):
         '''
@@ -202,7 +308,7 @@ class Client(object):
             'wizardItemDelete': False
         }
 
-        return self.__post('/Basket/RemoveBasketItem', json=params)
+        return self.__call_api('POST', '/Basket/RemoveBasketItem', data=encode_json(params))
 
     def set_payment_method(self, method=PAYMENT_METHOD.CASH_ON_DELIVERY):
         '''
@@ -213,7 +319,7 @@ class Client(object):
         :rtype: requests.Response
         '''
         params = {'paymentMethod': method}
-        return self.__post('/PaymentOptions/SetPaymentMethod', json=params)
+        return self.__call_api('POST', '/PaymentOptions/SetPaymentMethod', data=encode_json(params))
 
     def set_delivery_address(self):
         '''
@@ -228,64 +334,46 @@ class Client(object):
         :return: A response having processes the payment.
         :rtype: requests.Response
         '''
+        cookies = self.session.cookies
+        token = cookies.get('__RequestVerificationToken') or cookies.get('XSRF-TOKEN')
+
         params = {
-            '__RequestVerificationToken': self.session.cookies,
+            '__RequestVerificationToken': token,
             'method': 'submit'
         }
 
-        return self.__post('/PaymentOptions/Proceed', json=params)
-
-    def __get(self, path, **kargs):
-        '''
-        Make a HTTP GET request to the Dominos UK API with the given parameters
-        for the current session.
-
-        :param string path: The API endpoint path.
-        :params list kargs: A list of arguments.
-        :return: A response from the Dominos UK API.
-        :rtype: response.Response
-        '''
-        return self.__call_api(self.session.get, path, **kargs)
+        return self.__call_api('POST', '/PaymentOptions/Proceed', data=encode_json(params))
 
-    def __post(self, path, **kargs):
+    @on_exception(
+        runtime, RateLimitError, max_tries=10, jitter=None, value=attrgetter('retry_after')
+    )
+    def __call_api(self, method, path, **kargs):
         '''
-        Make a HTTP POST request to the Dominos UK API with the given
-        parameters for the current session.
+        Make a HTTP request to the Dominos UK API with the given parameters for
+        the current session. Requests are throttled by a token bucket and a
+        rate limited response is retried after the delay the remote asked for,
+        or an adaptive delay when it did not say. Transient server errors are
+        retried by the session itself.
 
+        :param string method: The HTTP method.
         :param string path: The API endpoint path.
         :params list kargs: A list of arguments.
         :return: A response from the Dominos UK API.
         :rtype: response.Response
         '''
-        return self.__call_api(self.session.post, path, **kargs)
+        self.limiter.acquire()
+        response = self.session.request(method, self.BASE_URL + path, **kargs)
 
-    @on_exception(expo, (ApiError, RateLimitException), max_tries=10)
-    @limits(calls=5, period=1)
-    def __call_api(self, verb, path, **kargs):
-        '''
-        Make a HTTP request to the Dominos UK API with the given parameters for
-        the current session.
+        throttled = response.status_code == 429
+        self.backoff.record(throttled)
 
-        :param verb func: HTTP method on the session.
-        :param string path: The API endpoint path.
-        :params list kargs: A list of arguments.
-        :return: A response from the Dominos UK API.
-        :rtype: response.Response
-        '''
-        response = verb(self.__url(path), **kargs)
+        if throttled:
+            delay = parse_retry_after(response.headers.get('Retry-After'))
+            if delay is None:
+                delay = self.backoff.delay()
+            raise RateLimitError('{}: {}'.format(response.status_code, response), delay)
 
-        if response.status_code != 200:
+        if response.status_code not in (200, 304):
             raise ApiError('{}: {}'.format(response.status_code, response))
 
         return response
-
-    def __url(self, path):
-        '''
-        Helper method to generate fully qualified URIs pertaining to specific
-        API actions.
-
-        :param string path: Relative API path to resource.
-        :return: Fully qualified URI to API resource.
-        :rtype: string
-        '''
-        return self.BASE_URL + path
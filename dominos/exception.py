@@ -6,3 +6,13 @@ class ApiError(Exception):
     API exception class. It is exactly the same as a regular exception.
     '''
     pass
+
+class RateLimitError(ApiError):
+    '''
+    API exception raised when the remote rejects a request for exceeding its
+    rate limit. Carries the number of seconds the remote asked the client to
+    wait before retrying, if it said so.
+    '''
+    def __init__(self, message, retry_after=None):
+        super(RateLimitError, self).__init__(message)
+        self.retry_after = retry_after
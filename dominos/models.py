@@ -1,37 +1,59 @@
 '''
 Dominos Pizza API models.
 '''
+from itertools import chain
+from operator import itemgetter
+
 from dominos.utils import strip_unicode_characters
 
-class Stores(object):
+ITEM_FIELDS = itemgetter('productId', 'name', 'price', 'productSkus', 'type')
+
+class Stores(list):
     '''
-    Encapsulates a list of nearby stores returned from the API.
+    Encapsulates a list of nearby stores returned from the API. The list holds
+    the stores from which an order may be collected and behaves as any other
+    list: it compares equal to a plain list of the same stores and is not
+    hashable.
     '''
+    __slots__ = ('local_store',)
+
     def __init__(self, data):
         delivery_available = data.get('localStoreCanDeliverToAddress', False)
         collection_stores = data.get('collectionStores', [])
 
+        super(Stores, self).__init__(Store(s) for s in collection_stores)
+
         self.local_store = None
         if 'localStore' in data:
-            self.local_store = Store(data['localStore'], delivery_available)
-        self.collection_stores = [Store(s) for s in collection_stores]
-
-    def __getitem__(self, idx):
-        return self.collection_stores[idx]
+            # The local store is usually also a collection store, so reuse it
+            # unless it delivers, which its collection entry must not claim.
+            local_id = data['localStore']['id']
+            local_store = None
+            if not delivery_available:
+                local_store = next((s for s in self if s.store_id == local_id), None)
+            if local_store is None:
+                local_store = Store(data['localStore'], delivery_available)
+            self.local_store = local_store
+
+    @property
+    def collection_stores(self):
+        '''
+        The stores from which an order may be collected.
 
-    def __len__(self):
-        return len(self.collection_stores)
+        :return: This list of stores.
+        :rtype: Stores
+        '''
+        return self
 
     def __str__(self):
-        stores = ''
-        for store in self.collection_stores:
-            stores = stores + str(store) + '\n'
-        return stores
+        return '\n'.join(map(str, self)) + ('\n' if self else '')
 
 class Store(object):
     '''
     Encapsulates a single store returned from the API.
     '''
+    __slots__ = ('store_id', 'name', 'is_open', 'collection', 'delivery_available', 'menu_version')
+
     def __init__(self, data, delivery_available=False):
         self.store_id = data['id']
         self.name = data['name']
@@ -41,71 +63,91 @@ class Store(object):
         self.menu_version = data['menuVersion']
 
     def __eq__(self, other):
+        if not isinstance(other, Store):
+            return NotImplemented
         return self.store_id == other.store_id
 
-    def __ne__(self, other):
-        return not self.__eq__(other)
+    def __hash__(self):
+        return hash(self.store_id)
 
     def __str__(self):
-        return 'name: {}, open: {}'.format(self.name, self.is_open)
+        return f'name: {self.name}, open: {self.is_open}'
 
 class Menu(object):
     '''
     Encapsulates a store menu.
     '''
+    __slots__ = ('items', '_by_name', '_by_id')
+
     def __init__(self, data):
-        self.items = [Item(i) for category in data for i in category['subcategories'][0]['products']]
+        products = chain.from_iterable(c['subcategories'][0]['products'] for c in data)
+        self.items = list(map(Item, products))
+
+        # Index in reverse so the first of any duplicates wins, as a scan would.
+        self._by_name = {i._name_key: i for i in reversed(self.items)}
+        self._by_id = {i.item_id: i for i in reversed(self.items)}
 
     def get_product_by_name(self, name):
         '''
         Gets a Item from the Menu by name. Note that the name is not
-        case-sensitive but must be spelt correctly.
+        case-sensitive but must be spelt correctly. Symbols such as trademarks
+        are ignored, as they are in item names.
 
         :param string name: The name of the item.
         :raises StopIteration: Raises exception if no item is found.
         :return: An item object matching the search.
         :rtype: Item
         '''
-        return next(i for i in self.items if i.name.lower() == name.lower())
+        try:
+            return self._by_name[strip_unicode_characters(name).casefold()]
+        except KeyError:
+            raise StopIteration(name) from None
 
     def __len__(self):
         return len(self.items)
 
+    def __iter__(self):
+        return iter(self.items)
+
+    def __contains__(self, item):
+        return isinstance(item, Item) and item.item_id in self._by_id
+
     def __getitem__(self, item_id):
-        return next(item for item in self.items if item.item_id == item_id)
+        return self._by_id[item_id]
 
     def __str__(self):
-        menu = ''
-        for item in self.items:
-            menu = menu + str(item) + '\n'
-        return menu
+        return '\n'.join(map(str, self.items)) + ('\n' if self.items else '')
 
 class Item(object):
     '''
     Encapsulates a sinlge menu item.
     '''
+    __slots__ = ('item_id', 'name', 'price', 'skus', 'type', '_name_key')
+
     def __init__(self, data):
-        self.item_id = data['productId']
-        self.name = strip_unicode_characters(data['name'])
-        self.price = data['price']
-        self.skus = data['productSkus']
-        self.type = data['type']
+        self.item_id, name, self.price, self.skus, self.type = ITEM_FIELDS(data)
+        self.name = strip_unicode_characters(name)
+        self._name_key = self.name.casefold()
 
     def __getitem__(self, variant):
         return self.skus[variant]
 
     def __eq__(self, other):
+        if not isinstance(other, Item):
+            return NotImplemented
         return self.item_id == other.item_id
 
-    def __ne__(self, other):
-        return not self.__eq__(other)
+    def __hash__(self):
+        return hash(self.item_id)
 
     def __str__(self):
-        return 'name: {}, type: {}, base price: {}'.format(self.name, self.type, self.price)
+        return f'name: {self.name}, type: {self.type}, base price: {self.price}'
 
 class Basket(object):
     '''
     Encapsulates a basket.
     '''
+    __slots__ = ('items',)
+
     def __init__(self, data):
         self.items = data['items']
@@ -0,0 +1,124 @@
+'''
+Dominos Pizza API rate limiting.
+
+This module includes the helpers used to pace requests to the Dominos Pizza UK
+API and to wait before retrying those that were rate limited.
+'''
+import random
+import threading
+import time
+
+from collections import deque
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+
+def parse_retry_after(value):
+    '''
+    Parse the value of a Retry-After header, which may be given either as a
+    number of seconds or as a HTTP date.
+
+    :param string value: The header value.
+    :return: The number of seconds to wait, or None if the value is missing or
+             malformed.
+    :rtype: float
+    '''
+    if not value:
+        return None
+
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+
+    try:
+        date = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+
+    if date.tzinfo is None:
+        date = date.replace(tzinfo=timezone.utc)
+
+    return max(0.0, (date - datetime.now(timezone.utc)).total_seconds())
+
+class TokenBucket(object):
+    '''
+    Thread safe token bucket rate limiter. Tokens refill continuously at the
+    given rate up to the bucket capacity and are spent as requests are sent,
+    so short bursts pass without waiting.
+    '''
+    def __init__(self, rate, capacity):
+        self.rate = float(rate)
+        self.capacity = float(capacity)
+        self._tokens = self.capacity
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        '''
+        Take a token from the bucket, sleeping until one becomes available.
+
+        :return: The number of seconds spent waiting.
+        :rtype: float
+        '''
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._last) * self.rate)
+            self._last = now
+            self._tokens -= 1
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+
+        if wait:
+            time.sleep(wait)
+
+        return wait
+
+class AdaptiveBackoff(object):
+    '''
+    Client side adaptive backoff. Tracks the share of recent responses that
+    were rate limited and scales the delay suggested before the next retry by
+    it. The base delay doubles on every rate limited response and halves on
+    every other, so the client eases off quickly under contention and recovers
+    once the remote accepts requests again.
+    '''
+    def __init__(self, base=0.2, max_value=30, window=60):
+        self.min_base = base
+        self.base = base
+        self.max_value = max_value
+        self.window = window
+        self._outcomes = deque()
+        self._throttled = 0
+        self._lock = threading.Lock()
+
+    def record(self, throttled):
+        '''
+        Record the outcome of a response.
+
+        :param bool throttled: Whether the response was rate limited.
+        '''
+        with self._lock:
+            now = time.monotonic()
+            self._outcomes.append((now, throttled))
+            self._throttled += throttled
+
+            while self._outcomes[0][0] < now - self.window:
+                self._throttled -= self._outcomes.popleft()[1]
+
+            if throttled:
+                self.base = min(self.max_value, self.base * 2)
+            else:
+                self.base = max(self.min_base, self.base / 2)
+
+    def delay(self):
+        '''
+        Suggest how long to wait before retrying a rate limited request. The
+        base delay is scaled by the density of recent rate limited responses
+        and then fully jittered.
+
+        :return: The number of seconds to wait.
+        :rtype: float
+        '''
+        with self._lock:
+            density = self._throttled / len(self._outcomes) if self._outcomes else 0.0
+            delay = min(self.max_value, self.base * (1 + density))
+
+        return random.uniform(0, delay)
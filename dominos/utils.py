@@ -1,28 +1,72 @@
 '''
 Dominos Pizza API utility functions.
 '''
-import re
+import threading
+import time
 
-def enum(**enums):
-    '''
-    Utility function to create a simple enum-like data type. Behind the scenes
-    it is just a list.
+try:
+    import orjson as json
+except ImportError:
+    import json
 
-    :param list enums: A list of key value pairs.
-    :return: A simple list.
-    :rtype: list
-    '''
-    return type('Enum', (), enums)
+DEFAULT_HEADERS = {
+    'Content-Type': 'application/json; charset=utf-8',
+    'Host': 'www.dominos.co.uk'
+}
 
 def strip_unicode_characters(text):
     '''
-    Remove the unicode symbols from the given string.
+    Remove the unicode symbols from the given string. Most names are plain
+    ASCII and are returned as they are without being copied.
 
     :param string text: The text containing the trademark symbol.
     :return: Text with the unicode symbols removed.
     :rtype: string
     '''
-    return re.sub(r'[^\x00-\x7F]+', '', text)
+    if text.isascii():
+        return text
+
+    return text.encode('ascii', 'ignore').decode('ascii')
+
+def decode_json(response):
+    '''
+    Decode the JSON body of a response. Parses the raw bytes with orjson when
+    it is installed, which is considerably faster than the standard library on
+    large payloads such as store menus.
+
+    :param requests.Response response: A response.
+    :return: The decoded body.
+    '''
+    return json.loads(response.content)
+
+def encode_json(data):
+    '''
+    Encode data as a JSON request body.
+
+    :param data: The data to encode.
+    :return: The encoded body.
+    :rtype: bytes
+    '''
+    body = json.dumps(data)
+    return body if isinstance(body, bytes) else body.encode('utf-8')
+
+def merge_basket_items(items):
+    '''
+    Merge additions of the same item and variant into a single addition with
+    the combined quantity, keeping the order in which items first appear.
+
+    :param list items: A list of (item, variant, quantity) tuples.
+    :return: A list of (item, variant, quantity) tuples.
+    :rtype: list
+    '''
+    merged = {}
+    for item, variant, quantity in items:
+        key = (item.item_id, variant)
+        if key in merged:
+            quantity += merged[key][2]
+        merged[key] = (item, variant, quantity)
+
+    return list(merged.values())
 
 def update_session_headers(session):
     '''
@@ -32,9 +76,113 @@ def update_session_headers(session):
     :return: A session with modified headers.
     :rtype: requests.sessions.Session
     '''
-    session.headers.update({
-        'Content-Type': 'application/json; charset=utf-8',
-        'Host': 'www.dominos.co.uk'
-    })
-
+    session.headers.update(DEFAULT_HEADERS)
     return session
+
+def xsrf_token_hook(session):
+    '''
+    Create a response hook that keeps the X-XSRF-TOKEN header of a session in
+    step with the XSRF-TOKEN cookie, updating it only when a response sets a
+    new cookie. The hook keeps a reference to its session so that it is
+    installed only once.
+
+    :param: requests.sessions.Session session: A session.
+    :return: A response hook.
+    :rtype: function
+    '''
+    def hook(response, *_args, **_kargs):
+        token = response.cookies.get('XSRF-TOKEN')
+        if token is not None:
+            session.headers['X-XSRF-TOKEN'] = token
+
+    hook.session = session
+    return hook
+
+def configure_session(session):
+    '''
+    Prepare a session for use against the API. Adds the default headers,
+    keeps the cross site request forgery header up to date and mounts a
+    connection pool that retries transient server errors at the connection
+    level. Only GET requests are retried once sent; a POST is retried only if
+    it never reached the remote. Rate limited responses, including their
+    Retry-After header, are left for the client to handle.
+
+    :param: requests.sessions.Session session: A session.
+    :return: A configured session.
+    :rtype: requests.sessions.Session
+    '''
+    # Imported here so the models may be used without loading the HTTP stack.
+    from requests.adapters import HTTPAdapter  # pylint: disable=import-outside-toplevel
+    from urllib3.util.retry import Retry  # pylint: disable=import-outside-toplevel
+
+    retries = Retry(
+        total=5,
+        backoff_factor=0.5,
+        status_forcelist=(500, 502, 503, 504),
+        allowed_methods=frozenset(['GET']),
+        raise_on_status=False,
+        respect_retry_after_header=False
+    )
+
+    adapter = HTTPAdapter(pool_connections=10, pool_maxsize=20, max_retries=retries)
+    session.mount('https://', adapter)
+
+    hooks = session.hooks['response']
+    if not any(getattr(hook, 'session', None) is session for hook in hooks):
+        hooks.append(xsrf_token_hook(session))
+
+    return update_session_headers(session)
+
+class TTLCache(object):
+    '''
+    Thread safe in memory cache whose entries expire a fixed number of seconds
+    after they are set. Expired entries are purged whenever a new one is set
+    and the oldest entry is evicted once the cache holds maxsize entries.
+    '''
+    def __init__(self, maxsize=128):
+        self.maxsize = maxsize
+        self._entries = {}
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        '''
+        Get an entry from the cache.
+
+        :param tuple key: The cache key.
+        :return: The cached value, or None if it is missing or has expired.
+        '''
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+
+            expires, value = entry
+            if expires <= time.monotonic():
+                del self._entries[key]
+                return None
+
+            return value
+
+    def set(self, key, value, expire):
+        '''
+        Add an entry to the cache.
+
+        :param tuple key: The cache key.
+        :param value: The value to cache.
+        :param int expire: The number of seconds until the entry expires.
+        '''
+        with self._lock:
+            now = time.monotonic()
+            self._entries = {k: e for k, e in self._entries.items() if e[0] > now and k != key}
+
+            if len(self._entries) >= self.maxsize:
+                del self._entries[next(iter(self._entries))]
+
+            self._entries[key] = (now + expire, value)
+
+    def clear(self):
+        '''
+        Remove every entry from the cache.
+        '''
+        with self._lock:
+            self._entries.clear()
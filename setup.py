@@ -1,6 +1,11 @@
+import re
+
 from setuptools import setup
 
-import dominos
+def version():
+    '''Read the package version without importing it'''
+    with open('dominos/__init__.py') as infile:
+        return re.search(r"^__version__ = '([^']+)'", infile.read(), re.M).group(1)
 
 def readme():
     '''Read README file'''
@@ -9,7 +14,7 @@ def readme():
 
 setup(
     name='dominos',
-    version=dominos.__version__,
+    version=version(),
     description='Dominos Pizza UK API wrapper',
     long_description=readme().strip(),
     author='Tomas Basham',
@@ -17,10 +22,15 @@ setup(
     url='https://github.com/tomasbasham/dominos',
     license='MIT',
     packages=['dominos'],
+    python_requires='>=3.7',
     install_requires=[
-        'ratelimit',
-        'requests'
+        'backoff>=2.0',
+        'requests',
+        'urllib3>=1.26'
     ],
+    extras_require={
+        'fast': ['orjson']
+    },
     keywords=[
         'dominos',
         'pizza',
@@ -32,6 +42,7 @@ setup(
         'License :: OSI Approved :: MIT License',
         'Natural Language :: English',
         'Programming Language :: Python',
+        'Programming Language :: Python :: 3',
         'Topic :: Software Development'
     ],
     include_package_data=True,
@@ -1,5 +1,41 @@
 import unittest
 
+from unittest.mock import Mock
+
+import requests
+
+from dominos.api import Client
+
 __all__ = [
+    'ClientTestCase',
+    'SessionTestCase',
+    'response',
     'unittest'
 ]
+
+def response(status=200, content=b'{}', headers=None):
+    resp = requests.Response()
+    resp.status_code = status
+    resp._content = content
+    resp.headers.update(headers or {})
+    return resp
+
+class SessionTestCase(unittest.TestCase):
+    '''
+    Provides a session whose requests are answered by a stub instead of the
+    remote.
+    '''
+    def setUp(self):
+        self.session = requests.Session()
+        self.session.request = Mock(return_value=response())
+
+class ClientTestCase(SessionTestCase):
+    '''
+    Provides a Client over a stubbed session that is never rate limited. The
+    request made by the Client on construction is forgotten.
+    '''
+    def setUp(self):
+        super().setUp()
+        self.client = Client(self.session)
+        self.client.limiter.acquire = Mock(return_value=0.0)
+        self.session.request.reset_mock()
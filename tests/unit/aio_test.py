@@ -0,0 +1,64 @@
+import asyncio
+
+from unittest.mock import patch
+
+from dominos.aio import AsyncClient
+from dominos.exception import ApiError
+from tests import SessionTestCase, response
+
+class TestAsyncClient(SessionTestCase):
+    def test_method_before_enter_raises(self):
+        api = AsyncClient(self.session)
+        with self.assertRaises(RuntimeError):
+            asyncio.run(api.get_basket())
+
+    def test_delegates_to_client(self):
+        async def run():
+            async with AsyncClient(self.session) as api:
+                self.session.request.return_value = response(content=b'{"items": [1]}')
+                return await api.get_basket()
+
+        self.assertEqual(asyncio.run(run()).items, [1])
+
+    def test_exit_closes_own_session(self):
+        async def run():
+            async with AsyncClient() as api:
+                return api
+
+        with patch('dominos.aio.requests.Session', return_value=self.session), \
+             patch.object(self.session, 'close') as close:
+            api = asyncio.run(run())
+
+        close.assert_called_once_with()
+        self.assertIsNone(api.client)
+
+    def test_exit_leaves_given_session_open(self):
+        async def run():
+            async with AsyncClient(self.session):
+                pass
+
+        with patch.object(self.session, 'close') as close:
+            asyncio.run(run())
+
+        close.assert_not_called()
+
+    def test_may_be_entered_again(self):
+        api = AsyncClient(self.session)
+
+        async def run():
+            async with api:
+                return await api.get_basket()
+
+        self.session.request.return_value = response(content=b'{"items": []}')
+        self.assertEqual(asyncio.run(run()).items, [])
+        self.assertEqual(asyncio.run(run()).items, [])
+
+    def test_failed_enter_shuts_down_executor(self):
+        api = AsyncClient(self.session)
+        self.session.request.return_value = response(500)
+
+        with self.assertRaises(ApiError):
+            asyncio.run(api.__aenter__())
+
+        self.assertIsNone(api.client)
+        self.assertIsNone(api._executor)
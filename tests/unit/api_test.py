@@ -1,5 +1,170 @@
-from dominos.api import Client
-from tests import unittest
+import json
 
-class TestClient(unittest.TestCase):
-    pass
+from unittest.mock import patch
+
+from dominos.api import VARIANT
+from dominos.exception import ApiError, RateLimitError
+from dominos.models import Item, Store
+from tests import ClientTestCase, response
+
+def sent_body(request):
+    return json.loads(request.call_args.kwargs['data'])
+
+class TestClient(ClientTestCase):
+    def test_rate_limited_request_is_retried_after_delay(self):
+        self.session.request.side_effect = [
+            response(429, headers={'Retry-After': '0'}),
+            response(content=b'{"items": [1]}')
+        ]
+
+        self.assertEqual(self.client.get_basket().items, [1])
+        self.assertEqual(self.session.request.call_count, 2)
+
+    def test_rate_limited_request_falls_back_to_adaptive_delay(self):
+        self.session.request.side_effect = [response(429), response(content=b'{"items": []}')]
+
+        with patch.object(self.client.backoff, 'delay', return_value=0) as delay:
+            self.assertEqual(self.client.get_basket().items, [])
+
+        delay.assert_called_once_with()
+        self.assertEqual(self.session.request.call_count, 2)
+
+    def test_rate_limit_error_carries_delay(self):
+        self.session.request.return_value = response(429, headers={'Retry-After': '0'})
+
+        with self.assertRaises(RateLimitError) as context:
+            self.client.get_basket()
+
+        self.assertEqual(context.exception.retry_after, 0)
+        self.assertEqual(self.session.request.call_count, 10)
+
+    def test_other_errors_are_not_retried(self):
+        self.session.request.return_value = response(500)
+
+        with self.assertRaises(ApiError):
+            self.client.get_basket()
+
+        self.assertEqual(self.session.request.call_count, 1)
+
+    def test_requests_take_a_token(self):
+        self.client.reset_store()
+        self.client.limiter.acquire.assert_called_once_with()
+
+class TestAddPizzaToBasket(ClientTestCase):
+    def test_sends_base_and_sku_ingredients(self):
+        sku = {'productSkuId': 7, 'ingredients': [1, 2]}
+        pizza = Item({
+            'productId': 3,
+            'name': 'Original Cheese & Tomato',
+            'price': '9.99',
+            'productSkus': [sku] * 4,
+            'type': 'Pizza'
+        })
+
+        self.client.add_pizza_to_basket(pizza, VARIANT.LARGE, quantity=2)
+
+        body = sent_body(self.session.request)
+        self.assertEqual(body['ingredients'], [42, 36, 1, 2])
+        self.assertEqual(body['sizeId'], VARIANT.LARGE)
+        self.assertEqual(body['quantity'], 2)
+        self.assertEqual(body['productId'], 3)
+        self.assertEqual(sku['ingredients'], [1, 2])
+
+class TestProcessPayment(ClientTestCase):
+    def test_sends_request_verification_token(self):
+        self.session.cookies.set('XSRF-TOKEN', 'xsrf')
+        self.session.cookies.set('__RequestVerificationToken', 'token')
+
+        self.client.process_payment()
+
+        body = sent_body(self.session.request)
+        self.assertEqual(body, {'__RequestVerificationToken': 'token', 'method': 'submit'})
+
+    def test_falls_back_to_xsrf_token(self):
+        self.session.cookies.set('XSRF-TOKEN', 'xsrf')
+
+        self.client.process_payment()
+
+        self.assertEqual(sent_body(self.session.request)['__RequestVerificationToken'], 'xsrf')
+
+class TestGetStores(ClientTestCase):
+    def setUp(self):
+        super().setUp()
+
+        store = b'{"id": 1, "name": "Cardiff", "menuVersion": "v1"}'
+        self.session.request.return_value = response(content=b'{"collectionStores": [%s]}' % store)
+
+    def test_cached_search_returns_a_new_list(self):
+        stores = self.client.get_stores('Cardiff')
+        stores.pop()
+
+        self.assertEqual(len(self.client.get_stores('cardiff ')), 1)
+        self.session.request.assert_called_once()
+
+    def test_invalidate_forgets_searches(self):
+        self.client.get_stores('Cardiff')
+        self.client.invalidate()
+        self.client.get_stores('Cardiff')
+
+        self.assertEqual(self.session.request.call_count, 2)
+
+class TestGetMenu(ClientTestCase):
+    def setUp(self):
+        super().setUp()
+        self.store = Store({'id': 1, 'name': 'Cardiff', 'menuVersion': 'v1'})
+
+        self.session.request.return_value = response(content=b'[]', headers={
+            'ETag': '"abc"',
+            'Last-Modified': 'Wed, 21 Oct 2015 07:28:00 GMT'
+        })
+        self.menu = self.client.get_menu(self.store)
+        self.session.request.reset_mock()
+
+    def test_cached_menu_sends_no_request(self):
+        self.assertIs(self.client.get_menu(self.store), self.menu)
+        self.session.request.assert_not_called()
+
+    def test_expired_menu_is_revalidated(self):
+        self.client.cache.clear()
+        self.session.request.return_value = response(304)
+
+        self.assertIs(self.client.get_menu(self.store), self.menu)
+        self.assertEqual(self.session.request.call_args.kwargs['headers'], {
+            'If-None-Match': '"abc"',
+            'If-Modified-Since': 'Wed, 21 Oct 2015 07:28:00 GMT'
+        })
+
+    def test_invalidate_fetches_menu_without_validators(self):
+        self.client.invalidate()
+        self.session.request.return_value = response(content=b'[]')
+
+        self.assertIsNot(self.client.get_menu(self.store), self.menu)
+        self.session.request.assert_called_once()
+        self.assertNotIn('If-None-Match', self.session.request.call_args.kwargs['headers'])
+
+    def test_new_menu_version_replaces_old(self):
+        self.store.menu_version = 'v2'
+        self.session.request.return_value = response(content=b'[]')
+
+        self.assertIsNot(self.client.get_menu(self.store), self.menu)
+        self.assertEqual(self.session.request.call_args.kwargs['headers'], {})
+        self.assertEqual(len(self.client._menu_cache), 1)
+
+class TestGetMenuAndBasket(ClientTestCase):
+    def test_fetches_menu_and_basket(self):
+        store = Store({'id': 1, 'name': 'Cardiff', 'menuVersion': 'v1'})
+        responses = {
+            'GetStoreCatalog': response(content=b'[]'),
+            'GetBasket': response(content=b'{"items": [1]}')
+        }
+
+        def request(method, url, **kargs):
+            return responses[url.rsplit('/', 1)[1]]
+
+        self.session.request.side_effect = request
+
+        menu, basket = self.client.get_menu_and_basket(store)
+
+        self.assertEqual(menu.items, [])
+        self.assertEqual(basket.items, [1])
+        self.assertEqual(self.session.request.call_count, 2)
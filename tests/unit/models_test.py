@@ -0,0 +1,80 @@
+from dominos.models import Item, Menu, Stores
+from tests import unittest
+
+def product(product_id, name, product_type='Side'):
+    return {
+        'productId': product_id,
+        'name': name,
+        'price': '1.99',
+        'productSkus': [{'productSkuId': product_id, 'ingredients': []}],
+        'type': product_type
+    }
+
+class TestMenu(unittest.TestCase):
+    def setUp(self):
+        self.menu = Menu([
+            {'subcategories': [{'products': [
+                product(1, 'Potato Wedges'),
+                product(2, 'Garlic Bread')
+            ]}]},
+            {'subcategories': [{'products': [product(3, 'Original Cheese & Tomato', 'Pizza')]}]}
+        ])
+
+    def test_get_product_by_name_ignores_case(self):
+        self.assertEqual(self.menu.get_product_by_name('potato WEDGES').item_id, 1)
+
+    def test_get_product_by_name_raises_when_missing(self):
+        with self.assertRaises(StopIteration):
+            self.menu.get_product_by_name('Chips')
+
+    def test_index_by_item_id(self):
+        self.assertEqual(self.menu[3].name, 'Original Cheese & Tomato')
+        self.assertEqual(len(self.menu), 3)
+
+    def test_iterates_and_checks_membership_of_items(self):
+        self.assertEqual([item.item_id for item in self.menu], [1, 2, 3])
+        self.assertIn(self.menu[2], self.menu)
+        self.assertNotIn(Item(product(4, 'Chips')), self.menu)
+        self.assertNotIn(1, self.menu)
+
+    def test_str_lists_one_item_per_line(self):
+        self.assertEqual(str(self.menu).count('\n'), 3)
+        self.assertTrue(str(self.menu).startswith('name: Potato Wedges, type: Side'))
+
+    def test_get_product_by_name_ignores_symbols(self):
+        self.assertEqual(self.menu.get_product_by_name('Garlic Bread™').item_id, 2)
+
+class TestItem(unittest.TestCase):
+    def test_items_with_the_same_id_are_equal_and_hash_alike(self):
+        first, second = Item(product(1, 'Potato Wedges')), Item(product(1, 'Potato Wedges'))
+        self.assertEqual(first, second)
+        self.assertEqual(len({first, second}), 1)
+
+    def test_items_are_not_equal_to_other_types(self):
+        self.assertNotEqual(Item(product(1, 'Potato Wedges')), 1)
+
+class TestStores(unittest.TestCase):
+    def test_local_store_reuses_matching_collection_store(self):
+        local = {'id': 1, 'name': 'Local', 'menuVersion': 'v1'}
+        other = {'id': 2, 'name': 'Other', 'menuVersion': 'v1'}
+        stores = Stores({'localStore': local, 'collectionStores': [other, local]})
+
+        self.assertIs(stores.local_store, stores[1])
+        self.assertFalse(stores.local_store.delivery_available)
+
+    def test_delivering_local_store_leaves_collection_store_alone(self):
+        local = {'id': 1, 'name': 'Local', 'menuVersion': 'v1'}
+        stores = Stores({
+            'localStore': local,
+            'localStoreCanDeliverToAddress': True,
+            'collectionStores': [local]
+        })
+
+        self.assertTrue(stores.local_store.delivery_available)
+        self.assertFalse(stores[0].delivery_available)
+        self.assertEqual(stores.local_store, stores[0])
+
+    def test_local_store_without_collection_match(self):
+        stores = Stores({'localStore': {'id': 1, 'name': 'Local', 'menuVersion': 'v1'}})
+        self.assertEqual(stores.local_store.store_id, 1)
+        self.assertEqual(len(stores), 0)
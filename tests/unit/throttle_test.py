@@ -0,0 +1,43 @@
+from unittest.mock import call, patch
+
+from dominos.throttle import AdaptiveBackoff, TokenBucket, parse_retry_after
+from tests import unittest
+
+class TestParseRetryAfter(unittest.TestCase):
+    def test_seconds(self):
+        self.assertEqual(parse_retry_after('3'), 3.0)
+
+    def test_http_date_in_the_past(self):
+        self.assertEqual(parse_retry_after('Wed, 21 Oct 2015 07:28:00 GMT'), 0.0)
+
+    def test_missing_or_malformed(self):
+        self.assertIsNone(parse_retry_after(None))
+        self.assertIsNone(parse_retry_after('soon'))
+
+class TestTokenBucket(unittest.TestCase):
+    def test_burst_within_capacity_does_not_wait(self):
+        bucket = TokenBucket(rate=1, capacity=3)
+        self.assertEqual([bucket.acquire() for _ in range(3)], [0.0, 0.0, 0.0])
+
+    @patch('dominos.throttle.time')
+    def test_waits_for_a_token_once_empty(self, clock):
+        clock.monotonic.return_value = 100.0
+        bucket = TokenBucket(rate=4, capacity=1)
+        self.assertEqual(bucket.acquire(), 0.0)
+        self.assertEqual(bucket.acquire(), 0.25)
+        self.assertEqual(bucket.acquire(), 0.5)
+        self.assertEqual(clock.sleep.call_args_list, [call(0.25), call(0.5)])
+
+class TestAdaptiveBackoff(unittest.TestCase):
+    def test_base_doubles_when_throttled_and_halves_otherwise(self):
+        backoff = AdaptiveBackoff(base=1, max_value=8)
+        for _ in range(4):
+            backoff.record(True)
+        self.assertEqual(backoff.base, 8)
+        backoff.record(False)
+        self.assertEqual(backoff.base, 4)
+
+    def test_delay_is_bounded_by_density(self):
+        backoff = AdaptiveBackoff(base=1, max_value=30)
+        backoff.record(True)
+        self.assertLessEqual(backoff.delay(), 4)
@@ -0,0 +1,79 @@
+from unittest.mock import Mock
+
+import requests
+from urllib3.exceptions import ConnectTimeoutError, ReadTimeoutError
+
+from dominos.utils import (
+    TTLCache, configure_session, merge_basket_items, strip_unicode_characters, xsrf_token_hook
+)
+from tests import unittest
+
+class TestTTLCache(unittest.TestCase):
+    def test_get_returns_value_until_expired(self):
+        cache = TTLCache()
+        cache.set('fresh', 1, expire=60)
+        cache.set('stale', 2, expire=0)
+        self.assertEqual(cache.get('fresh'), 1)
+        self.assertIsNone(cache.get('stale'))
+        self.assertIsNone(cache.get('missing'))
+
+    def test_set_purges_expired_entries(self):
+        cache = TTLCache()
+        cache.set('stale', 1, expire=0)
+        cache.set('fresh', 2, expire=60)
+        self.assertEqual(list(cache._entries), ['fresh'])
+
+    def test_set_evicts_oldest_entry_when_full(self):
+        cache = TTLCache(maxsize=2)
+        for key in ('a', 'b', 'c'):
+            cache.set(key, key, expire=60)
+        self.assertIsNone(cache.get('a'))
+        self.assertEqual([cache.get('b'), cache.get('c')], ['b', 'c'])
+
+class TestXsrfTokenHook(unittest.TestCase):
+    def test_updates_header_when_cookie_is_set(self):
+        session = requests.Session()
+        hook = xsrf_token_hook(session)
+
+        response = requests.Response()
+        hook(response)
+        self.assertNotIn('X-XSRF-TOKEN', session.headers)
+
+        response.cookies.set('XSRF-TOKEN', 'token')
+        hook(response)
+        self.assertEqual(session.headers['X-XSRF-TOKEN'], 'token')
+
+class TestConfigureSession(unittest.TestCase):
+    def setUp(self):
+        session = configure_session(requests.Session())
+        self.retries = session.get_adapter('https://www.dominos.co.uk').max_retries
+
+    def test_leaves_retry_after_to_the_client(self):
+        self.assertFalse(self.retries.respect_retry_after_header)
+        self.assertFalse(self.retries.is_retry('GET', 429, has_retry_after=True))
+
+    def test_retries_server_errors_for_get_only(self):
+        self.assertTrue(self.retries.is_retry('GET', 503))
+        self.assertFalse(self.retries.is_retry('POST', 503))
+
+    def test_installs_xsrf_token_hook_once(self):
+        session = configure_session(configure_session(requests.Session()))
+        self.assertEqual(len(session.hooks['response']), 1)
+
+    def test_retries_post_only_before_it_is_sent(self):
+        self.assertIsNotNone(self.retries.increment('POST', '/', error=ConnectTimeoutError()))
+        with self.assertRaises(ReadTimeoutError):
+            self.retries.increment('POST', '/', error=ReadTimeoutError(None, '/', 'timed out'))
+
+class TestMergeBasketItems(unittest.TestCase):
+    def test_combines_quantities_of_identical_items(self):
+        pizza, side = Mock(item_id=1), Mock(item_id=2)
+        items = [(pizza, 2, 1), (side, 0, 1), (pizza, 2, 2), (pizza, 3, 1)]
+        self.assertEqual(merge_basket_items(items), [(pizza, 2, 3), (side, 0, 1), (pizza, 3, 1)])
+
+class TestStripUnicodeCharacters(unittest.TestCase):
+    def test_removes_symbols(self):
+        self.assertEqual(strip_unicode_characters('Mighty Meaty® Pizza™'), 'Mighty Meaty Pizza')
+
+    def test_leaves_ascii_untouched(self):
+        self.assertEqual(strip_unicode_characters('Potato Wedges'), 'Potato Wedges')